@@ -4,25 +4,41 @@ Configuration file for JSON translation scripts.
 Centralizes all settings for easy maintenance and modification.
 """
 
+import os
+import sys
 from pathlib import Path
 from typing import Final
 
 # Directory Configuration
 JSON_DIR: Final[Path] = Path(__file__).parent
 OUTPUT_DIR: Final[Path] = JSON_DIR
+CACHE_FILE: Final[Path] = JSON_DIR / 'translation_cache.json'  # Persistent translation cache
+STATE_FILE: Final[str] = '.translation_state.json'  # Per-directory record of completed passes
+VERIFY_CACHE_FILE: Final[str] = '.verify_cache.json'  # Per-directory memo of verification results
+BACKUP_DIR: Final[str] = 'backup_before_numbering'  # Created by number_files.py
+RECURSIVE_SCAN: Final[bool] = False  # Also process JSON files in subdirectories
+
+# Metadata files stored alongside the data that must never be processed
+METADATA_FILES: Final[tuple] = ('filename_mapping.json', CACHE_FILE.name, STATE_FILE, VERIFY_CACHE_FILE)
 
 # Translation Configuration
 SOURCE_LANGUAGE: Final[str] = 'ar'  # Arabic
 TARGET_LANGUAGE: Final[str] = 'en'  # English
-TRANSLATION_SUFFIX: Final[str] = '-en'
+TRANSLATION_SUFFIX: Final[str] = sys.intern('-en')  # Interned: compared against every key
+TRANSLATION_SUFFIX_LEN: Final[int] = len(TRANSLATION_SUFFIX)
 
 # Performance Configuration
 MAX_CHUNK_SIZE: Final[int] = 500  # Maximum characters per translation chunk
+BATCH_SIZE: Final[int] = 50  # Texts per work unit handed to a translation thread
 MAX_RETRIES: Final[int] = 5  # Maximum retry attempts for failed translations
-BASE_DELAY: Final[float] = 0.5  # Base delay between translations (seconds)
-CHUNK_DELAY: Final[float] = 1.0  # Delay between chunks (seconds)
+REQUESTS_PER_SECOND: Final[float] = 5.0  # Request rate shared by all threads
+MIN_REQUESTS_PER_SECOND: Final[float] = 0.2  # Floor when backing off after rate limiting
+RATE_INCREASE: Final[float] = 0.05  # Requests/second regained after each success
 RETRY_DELAY: Final[float] = 3.0  # Delay between retries (seconds)
 MAX_WORKERS: Final[int] = 3  # Number of concurrent file processors
+READ_AHEAD: Final[int] = 8  # Files read ahead while earlier ones are verified
+STREAM_MIN_BYTES: Final[int] = 64 * 1024 * 1024  # Verify files this large incrementally (needs ijson)
+STREAM_BATCH_SIZE: Final[int] = 1000  # Items held in memory at a time when streaming
 
 # Chunk Detection
 MIN_CHUNK_RATIO: Final[float] = 0.5  # Minimum ratio for finding break points
@@ -31,3 +47,10 @@ SENTENCE_DELIMITERS: Final[tuple] = ('. ', '.\n', '؟ ', '! ', '، ', '\n\n', '\
 # Output Configuration
 JSON_INDENT: Final[int] = 2  # JSON file indentation
 ENCODING: Final[str] = 'utf-8'  # File encoding
+
+# Progress Output Configuration
+PROGRESS_FLUSH_LINES: Final[int] = 100  # Buffered progress lines before writing
+PROGRESS_FLUSH_INTERVAL: Final[float] = 0.5  # Maximum seconds progress stays buffered
+
+# Logging Configuration
+LOG_LEVEL: Final[str] = os.environ.get('TRANSLATION_LOG_LEVEL', 'INFO').upper()  # DEBUG shows per-field progress
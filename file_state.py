@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+File State Tracking
+Remembers which passes have already run over each data file so that
+incremental reruns can skip files that haven't changed since.
+
+A file is identified by its modification time and size. Any write to the
+file (by these scripts or by hand) changes that fingerprint and clears the
+passes recorded for it.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+import config
+import json_io
+
+
+class FileStateTracker:
+    """Tracks completed passes per file in a sidecar JSON file."""
+    
+    def __init__(self, json_dir: Path):
+        """
+        Initialize tracker and load any saved state.
+        
+        Args:
+            json_dir: Directory containing JSON files
+        """
+        self.json_dir = json_dir
+        self.state_path = json_dir / config.STATE_FILE
+        self._state: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load saved state, ignoring a missing or unreadable sidecar."""
+        try:
+            state = json_io.read_file(self.state_path)
+        except (OSError, ValueError):
+            return {}
+        
+        return state if isinstance(state, dict) else {}
+    
+    def _key(self, file_path: Path) -> str:
+        """Return the state key of a file: its path relative to json_dir."""
+        try:
+            return file_path.relative_to(self.json_dir).as_posix()
+        except ValueError:
+            return str(file_path)
+    
+    @staticmethod
+    def _fingerprint(file_path: Path) -> List[int]:
+        """Return the (mtime_ns, size) fingerprint of a file."""
+        st = os.stat(file_path)
+        return [st.st_mtime_ns, st.st_size]
+    
+    def is_done(self, file_path: Path, operation: str) -> bool:
+        """
+        Check whether a pass already ran over the current version of a file.
+        
+        Args:
+            file_path: Path to JSON file
+            operation: Name of the pass (e.g. 'fix', 'retry')
+        
+        Returns:
+            True if the file is unchanged since the pass last completed;
+            False for a malformed entry or a file that can't be stat'ed
+        """
+        entry = self._state.get(self._key(file_path))
+        if not isinstance(entry, dict):
+            return False
+        
+        passes = entry.get('passes')
+        if not isinstance(passes, list) or operation not in passes:
+            return False
+        
+        try:
+            return entry.get('fingerprint') == self._fingerprint(file_path)
+        except OSError:
+            return False
+    
+    def mark_done(self, file_path: Path, operation: str) -> None:
+        """
+        Record that a pass completed over the current version of a file.
+        
+        Call this after any write to the file so the new fingerprint is stored.
+        
+        Args:
+            file_path: Path to JSON file
+            operation: Name of the pass (e.g. 'fix', 'retry')
+        """
+        fingerprint = self._fingerprint(file_path)
+        key = self._key(file_path)
+        entry = self._state.get(key)
+        
+        if (not isinstance(entry, dict) or entry.get('fingerprint') != fingerprint
+                or not isinstance(entry.get('passes'), list)):
+            entry = {'fingerprint': fingerprint, 'passes': []}
+            self._state[key] = entry
+        
+        if operation not in entry['passes']:
+            entry['passes'].append(operation)
+        
+        self._dirty = True
+    
+    def save(self) -> None:
+        """Write state to disk if anything changed."""
+        if self._dirty:
+            json_io.write_file(self.state_path, self._state)
+            self._dirty = False
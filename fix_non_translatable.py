@@ -7,11 +7,23 @@ This script identifies and fixes fields that contain values that shouldn't be
 translated but were marked as "failed" translations.
 """
 
-import json
+import re
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Pattern, Set
 
 import config
+from config import TRANSLATION_SUFFIX, TRANSLATION_SUFFIX_LEN
+import json_io
+from file_state import FileStateTracker
+
+
+def _ascii_case_pattern(word: str) -> str:
+    """Return a regex matching word with any ASCII letter case."""
+    return ''.join(
+        f'[{c.lower()}{c.upper()}]' if c.isascii() and c.isalpha() else re.escape(c)
+        for c in word
+    )
 
 
 class NonTranslatableFixer:
@@ -23,6 +35,14 @@ class NonTranslatableFixer:
         '0', '1', '2', '3', '4', '5', '6', '7', '8', '9'
     }
     
+    # Same check as `value.lower().strip() in NON_TRANSLATABLE_VALUES`,
+    # without allocating the lowered and stripped copies. Letters get
+    # explicit [xX] classes because re.IGNORECASE also folds non-ASCII
+    # lookalikes such as the long s in 'yeſ'
+    _NON_TRANSLATABLE_RE: Pattern[str] = re.compile(
+        r'\s*(?:' + '|'.join(map(_ascii_case_pattern, sorted(NON_TRANSLATABLE_VALUES))) + r')\s*'
+    )
+    
     def __init__(self, json_dir: Path):
         """
         Initialize fixer.
@@ -36,10 +56,7 @@ class NonTranslatableFixer:
     
     def fix_all_files(self) -> None:
         """Fix all JSON files in directory."""
-        json_files = sorted(self.json_dir.glob('*.json'))
-        
-        # Skip metadata files
-        json_files = [f for f in json_files if f.name not in ('filename_mapping.json',)]
+        json_files = list(json_io.walk_json_files(self.json_dir))
         
         print("="*70)
         print("FIXING NON-TRANSLATABLE FIELDS")
@@ -48,17 +65,29 @@ class NonTranslatableFixer:
         print("="*70)
         print()
         
+        state = FileStateTracker(self.json_dir)
+        files_unchanged = 0
+        
         for json_file in json_files:
+            # Nothing to fix if the file hasn't changed since the last fix pass
+            if state.is_done(json_file, 'fix'):
+                files_unchanged += 1
+                continue
+            
             try:
                 if self._fix_file(json_file):
                     self.files_modified += 1
+                state.mark_done(json_file, 'fix')
             except Exception as e:
                 print(f"✗ Error processing {json_file.name}: {e}")
         
+        state.save()
+        
         print()
         print("="*70)
         print("SUMMARY")
         print("="*70)
+        print(f"Files skipped (unchanged): {files_unchanged}")
         print(f"Files modified: {self.files_modified}")
         print(f"Fields fixed: {self.total_fixed}")
         print("="*70)
@@ -73,8 +102,8 @@ class NonTranslatableFixer:
         Returns:
             True if file was modified, False otherwise
         """
-        with open(file_path, 'r', encoding=config.ENCODING) as f:
-            data: List[Dict[str, Any]] = json.load(f)
+        raw = file_path.read_bytes()
+        data: List[Dict[str, Any]] = json_io.loads(raw)
         
         # Skip if not a list
         if not isinstance(data, list):
@@ -84,33 +113,29 @@ class NonTranslatableFixer:
         fixed_count = 0
         
         for item in data:
-            for key, value in list(item.items()):
-                # Skip if already translated
-                if key.endswith(config.TRANSLATION_SUFFIX):
-                    continue
+            # Only original fields; keys added below are never revisited
+            source_keys = tuple(k for k in item if k[-TRANSLATION_SUFFIX_LEN:] != TRANSLATION_SUFFIX)
+            
+            for key in source_keys:
+                value = item[key]
                 
-                if not isinstance(value, str):
+                # Only non-translatable string values are of interest
+                if not isinstance(value, str) or not self._NON_TRANSLATABLE_RE.fullmatch(value):
                     continue
                 
-                en_key = f"{key}{config.TRANSLATION_SUFFIX}"
+                en_key = key + TRANSLATION_SUFFIX
                 
-                # Check if this is a non-translatable value
-                if value.lower().strip() in self.NON_TRANSLATABLE_VALUES:
-                    # If translation exists and is different, fix it
-                    if en_key in item and item[en_key] != value:
-                        item[en_key] = value
-                        modified = True
-                        fixed_count += 1
-                    # If translation doesn't exist, add it
-                    elif en_key not in item:
-                        item[en_key] = value
-                        modified = True
-                        fixed_count += 1
+                # Add the translation if missing, or fix it if it differs
+                if item.get(en_key) != value:
+                    item[sys.intern(en_key)] = value
+                    modified = True
+                    fixed_count += 1
+        
+        # Only re-encode when something changed, and only write real changes
+        if modified:
+            modified = json_io.write_file_if_changed(file_path, data, raw)
         
         if modified:
-            with open(file_path, 'w', encoding=config.ENCODING) as f:
-                json.dump(data, f, ensure_ascii=False, indent=config.JSON_INDENT)
-            
             print(f"✓ Fixed {file_path.name}: {fixed_count} fields")
             self.total_fixed += fixed_count
         
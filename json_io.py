@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+JSON encoding helpers shared by the translation scripts.
+Uses orjson when it is installed and falls back to the standard library.
+
+Both paths work on bytes, so files are read and written as raw bytes,
+skipping the text IO layer. For the string-only data files in this repo
+they produce identical output. They are not identical in general:
+orjson formats some floats differently (1e16 rather than 1e+16), and it
+rejects NaN and Infinity, which the standard library accepts. Files
+containing those values fail to load while orjson is installed.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterator, List
+
+import config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson only emits UTF-8 with two-space indentation
+_USE_ORJSON: bool = (
+    orjson is not None
+    and config.JSON_INDENT == 2
+    and config.ENCODING.lower().replace('_', '-') in ('utf-8', 'utf8')
+)
+
+
+def loads(data: bytes) -> Any:
+    """
+    Parse JSON from raw file bytes.
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        Parsed Python object
+    """
+    if _USE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data.decode(config.ENCODING))
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to indented, non-ASCII-escaped JSON bytes.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        Encoded JSON document
+    """
+    if _USE_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=config.JSON_INDENT).encode(config.ENCODING)
+
+
+def list_json_files(json_dir: Path) -> List[Path]:
+    """
+    List the data files in a directory, sorted by name.
+
+    Uses os.scandir rather than Path.glob so only matching entries become
+    Path objects. Metadata files from config.METADATA_FILES are excluded.
+
+    Args:
+        json_dir: Directory containing JSON files
+
+    Returns:
+        Sorted list of JSON file paths
+    """
+    with os.scandir(json_dir) as entries:
+        names = [
+            entry.name for entry in entries
+            if entry.name.endswith('.json')
+            and entry.name not in config.METADATA_FILES
+            and entry.is_file()
+        ]
+
+    names.sort()
+    return [json_dir / name for name in names]
+
+
+def walk_json_files(root: Path, recursive: bool = config.RECURSIVE_SCAN) -> Iterator[Path]:
+    """
+    Yield the data files under a directory, sorted by path.
+
+    Without recursion this is list_json_files(). With recursion os.walk is
+    used rather than Path.rglob, pruning hidden directories and the
+    numbering backup directory.
+
+    Args:
+        root: Directory containing JSON files
+        recursive: Whether to descend into subdirectories
+
+    Yields:
+        JSON file paths
+    """
+    if not recursive:
+        yield from list_json_files(root)
+        return
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            name for name in dirnames
+            if not name.startswith('.') and name != config.BACKUP_DIR
+        )
+        directory = Path(dirpath)
+
+        for name in sorted(filenames):
+            if name.endswith('.json') and name not in config.METADATA_FILES:
+                yield directory / name
+
+
+def read_file(path: Path) -> Any:
+    """
+    Read and parse a JSON file with a single read of its raw bytes.
+
+    Args:
+        path: Path to JSON file
+
+    Returns:
+        Parsed Python object
+    """
+    return loads(path.read_bytes())
+
+
+def write_file(path: Path, obj: Any) -> None:
+    """
+    Serialize an object and write it to a JSON file in one call.
+
+    Args:
+        path: Path to JSON file
+        obj: Object to serialize
+    """
+    path.write_bytes(dumps(obj))
+
+
+def write_file_if_changed(path: Path, obj: Any, original: bytes) -> bool:
+    """
+    Write an object to a JSON file only if its encoding differs from disk.
+
+    Args:
+        path: Path to JSON file
+        obj: Object to serialize
+        original: Bytes the file was loaded from
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    data = dumps(obj)
+    if data == original:
+        return False
+
+    path.write_bytes(data)
+    return True
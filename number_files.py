@@ -10,12 +10,14 @@ Features:
 - Generates mapping file for reference
 """
 
-import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 import config
+import json_io
 
 
 class FileNumberer:
@@ -40,11 +42,8 @@ class FileNumberer:
         Returns:
             Dictionary mapping old names to new names
         """
-        # Get all JSON files (excluding backup files)
-        json_files = sorted([
-            f for f in self.json_dir.glob('*.json')
-            if not f.name.endswith('.backup')
-        ])
+        # Get all JSON files (excluding metadata files)
+        json_files = json_io.list_json_files(self.json_dir)
         
         if not json_files:
             print("No JSON files found!")
@@ -79,30 +78,45 @@ class FileNumberer:
         # Create backup if requested
         if create_backup:
             print("\n📦 Creating backup...")
-            backup_dir = self.json_dir / "backup_before_numbering"
+            backup_dir = self.json_dir / config.BACKUP_DIR
             backup_dir.mkdir(exist_ok=True)
             
-            for file_path in json_files:
-                shutil.copy2(file_path, backup_dir / file_path.name)
+            # Copies release the GIL during I/O, so threads overlap them
+            with ThreadPoolExecutor(max_workers=min(8, len(json_files))) as executor:
+                list(executor.map(
+                    lambda file_path: shutil.copy2(file_path, backup_dir / file_path.name),
+                    json_files
+                ))
             
             print(f"✓ Backup created at: {backup_dir}")
         
+        # Save mapping before renaming so an interrupted run can be recovered
+        mapping_path = self.json_dir / "filename_mapping.json"
+        json_io.write_file(mapping_path, mapping)
+        
+        print(f"\n✓ Mapping saved to: {mapping_path}")
+        
         # Perform renaming
         print("\n🔄 Renaming files...")
-        for old_path in json_files:
-            old_name = old_path.name
-            new_name = mapping[old_name]
-            new_path = old_path.parent / new_name
-            
-            old_path.rename(new_path)
-            print(f"  ✓ Renamed: {old_name}")
+        directory = str(self.json_dir)
+        completed: List[Tuple[str, str]] = []
         
-        # Save mapping to file
-        mapping_path = self.json_dir / "filename_mapping.json"
-        with open(mapping_path, 'w', encoding=config.ENCODING) as f:
-            json.dump(mapping, f, ensure_ascii=False, indent=2)
+        try:
+            for old_path in json_files:
+                old = str(old_path)
+                new = os.path.join(directory, mapping[old_path.name])
+                
+                os.rename(old, new)
+                completed.append((old, new))
+        except OSError:
+            # Undo partial work so the directory isn't left half renamed
+            for old, new in reversed(completed):
+                os.rename(new, old)
+            mapping_path.unlink()
+            print(f"✗ Renaming failed; {len(completed)} renamed files restored")
+            raise
         
-        print(f"\n✓ Mapping saved to: {mapping_path}")
+        print(f"  ✓ Renamed {len(completed)} files")
         
         return mapping
 
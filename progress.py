@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Buffered Progress Output
+Batches per-file progress lines into a few large stdout writes, which keeps
+output cheap when it is piped or redirected on long runs.
+"""
+
+import sys
+import time
+from typing import Any, List
+
+import config
+
+
+class BufferedProgress:
+    """
+    Collects progress lines and writes them to stdout in batches.
+    
+    Lines are written once config.PROGRESS_FLUSH_LINES have accumulated or
+    config.PROGRESS_FLUSH_INTERVAL seconds have passed since the last write,
+    and always when leaving a with block. Not thread-safe.
+    """
+    
+    def __init__(
+        self,
+        max_lines: int = config.PROGRESS_FLUSH_LINES,
+        interval: float = config.PROGRESS_FLUSH_INTERVAL
+    ):
+        """
+        Initialize progress buffer.
+        
+        Args:
+            max_lines: Number of buffered lines that triggers a flush
+            interval: Seconds after which buffered lines are flushed
+        """
+        self.max_lines = max_lines
+        self.interval = interval
+        self._lines: List[str] = []
+        self._last_flush = time.monotonic()
+    
+    def write(self, line: str) -> None:
+        """Buffer a line, flushing if the buffer is full or stale."""
+        self._lines.append(line)
+        
+        if (len(self._lines) >= self.max_lines
+                or time.monotonic() - self._last_flush >= self.interval):
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write all buffered lines with a single write call."""
+        if self._lines:
+            self._lines.append('')
+            sys.stdout.write('\n'.join(self._lines))
+            self._lines.clear()
+        
+        self._last_flush = time.monotonic()
+    
+    def __enter__(self) -> 'BufferedProgress':
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
@@ -11,20 +11,26 @@ Features:
 - Summary reporting
 """
 
-import json
+import logging
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Any
 
 import config
+from config import TRANSLATION_SUFFIX, TRANSLATION_SUFFIX_LEN
+import json_io
+from file_state import FileStateTracker
 from translate_json import Translator
 
+log = logging.getLogger(__name__)
+
 
 @dataclass
 class RetryStats:
     """Statistics for retry operations."""
     files_processed: int = 0
+    files_skipped: int = 0
     fields_retried: int = 0
     fields_fixed: int = 0
     fields_still_failed: int = 0
@@ -67,7 +73,7 @@ class TranslationRetrier:
         Returns:
             RetryStats with retry results
         """
-        json_files = sorted(self.json_dir.glob('*.json'))
+        json_files = list(json_io.walk_json_files(self.json_dir))
         stats = RetryStats()
         
         print("="*70)
@@ -78,10 +84,21 @@ class TranslationRetrier:
         print("="*70)
         print()
         
+        state = FileStateTracker(self.json_dir)
+        
         for json_file in json_files:
+            # Skip files whose last retry left nothing failed and that
+            # haven't changed since
+            if state.is_done(json_file, 'retry'):
+                stats.files_skipped += 1
+                continue
+            
             try:
                 result = self._retry_file(json_file)
                 
+                if result.fields_fixed == result.fields_retried:
+                    state.mark_done(json_file, 'retry')
+                
                 if result.fields_retried > 0:
                     stats.files_processed += 1
                     stats.fields_retried += result.fields_retried
@@ -100,6 +117,8 @@ class TranslationRetrier:
             except Exception as e:
                 print(f"\n✗ Error processing {json_file.name}: {e}")
         
+        state.save()
+        
         return stats
     
     def _retry_file(self, file_path: Path) -> FileRetryResult:
@@ -112,47 +131,47 @@ class TranslationRetrier:
         Returns:
             FileRetryResult with retry results
         """
-        with open(file_path, 'r', encoding=config.ENCODING) as f:
-            data: List[Dict[str, Any]] = json.load(f)
+        raw = file_path.read_bytes()
+        data: List[Dict[str, Any]] = json_io.loads(raw)
         
-        fields_retried = 0
         fields_fixed = 0
         modified = False
+        debug = log.isEnabledFor(logging.DEBUG)
         
-        for i, item in enumerate(data):
-            for key, value in list(item.items()):
-                # Skip if already translated or not a string
-                if key.endswith(config.TRANSLATION_SUFFIX):
-                    continue
-                
-                if not isinstance(value, str) or not value.strip():
-                    continue
-                
-                en_key = f"{key}{config.TRANSLATION_SUFFIX}"
-                
-                # Check if translation exists and failed (same as original)
-                if en_key in item and item[en_key] == value:
-                    print(f"\n  📝 {file_path.name} - Item {i+1} - Field '{key}'")
-                    print(f"     Length: {len(value)} chars")
-                    
-                    fields_retried += 1
-                    
-                    # Retry translation
-                    translated = self.translator.translate(value, verbose=False)
-                    
-                    # Check if translation succeeded (different from original)
-                    if translated != value:
-                        item[en_key] = translated
-                        modified = True
-                        fields_fixed += 1
-                        print(f"     ✓ Translation successful!")
-                    else:
-                        print(f"     ✗ Translation still failed")
+        # Filter first: a translation failed if it exists and equals the
+        # original string, so only those fields reach the translator
+        failed = [
+            (i, item, key, value)
+            for i, item in enumerate(data)
+            for key, value in item.items()
+            if key[-TRANSLATION_SUFFIX_LEN:] != TRANSLATION_SUFFIX
+            and isinstance(value, str)
+            and value.strip()
+            and item.get(key + TRANSLATION_SUFFIX) == value
+        ]
+        fields_retried = len(failed)
+        
+        # Retry all failed fields of the file at once; each distinct failed value is sent once
+        translations = self.translator.translate_many([value for _, _, _, value in failed])
+        
+        for (i, item, key, value), translated in zip(failed, translations):
+            if debug:
+                log.debug(f"  📝 {file_path.name} - Item {i+1} - Field '{key}' "
+                          f"({len(value)} chars)")
+            
+            # Check if translation succeeded (different from original)
+            if translated != value:
+                item[key + TRANSLATION_SUFFIX] = translated
+                modified = True
+                fields_fixed += 1
+                if debug:
+                    log.debug(f"     ✓ Translation successful!")
+            elif debug:
+                log.debug(f"     ✗ Translation still failed")
         
         # Save file if modifications were made
         if modified:
-            with open(file_path, 'w', encoding=config.ENCODING) as f:
-                json.dump(data, f, ensure_ascii=False, indent=config.JSON_INDENT)
+            modified = json_io.write_file_if_changed(file_path, data, raw)
         
         return FileRetryResult(
             filename=file_path.name,
@@ -173,6 +192,7 @@ def print_summary(stats: RetryStats) -> None:
     print("="*70)
     print("RETRY SUMMARY")
     print("="*70)
+    print(f"Files skipped (unchanged): {stats.files_skipped}")
     print(f"Files with failed translations: {stats.files_processed}")
     print(f"Total fields retried: {stats.fields_retried}")
     print(f"Successfully fixed: {stats.fields_fixed} ({stats.success_rate:.1f}%)")
@@ -189,6 +209,8 @@ def print_summary(stats: RetryStats) -> None:
 
 def main() -> None:
     """Main entry point."""
+    logging.basicConfig(level=config.LOG_LEVEL, format='%(message)s')
+    
     print("Initializing translator...")
     translator = Translator()
     print("✓ Translator ready\n")
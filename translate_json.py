@@ -12,18 +12,33 @@ Features:
 - Configurable via config.py
 """
 
-import json
+import atexit
+import logging
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+import deep_translator.google
+import requests
 from deep_translator import GoogleTranslator
+from deep_translator.exceptions import TooManyRequests
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
 
 # Import configuration
 import config
+from config import TRANSLATION_SUFFIX, TRANSLATION_SUFFIX_LEN
+import json_io
+from progress import BufferedProgress
+
+log = logging.getLogger(__name__)
 
 
 @dataclass
@@ -48,6 +63,16 @@ class FileResult:
     error: Optional[str] = None
 
 
+@dataclass
+class PendingFile:
+    """A loaded file whose queued fields are waiting for translation."""
+    path: Path
+    raw: bytes
+    data: List[Dict[str, Any]]
+    stats: TranslationStats
+    fields: List[Tuple[Dict[str, Any], str, str]] = field(default_factory=list)
+
+
 class TextChunker:
     """Handles intelligent text chunking for translation."""
     
@@ -87,31 +112,184 @@ class TextChunker:
         """Find optimal break point in text chunk."""
         min_position = int(max_size * config.MIN_CHUNK_RATIO)
         
+        # Only the tail past min_position can hold a usable break point, so
+        # bound each search to it instead of scanning the whole chunk
         for delimiter in config.SENTENCE_DELIMITERS:
-            pos = chunk.rfind(delimiter)
-            if pos > min_position:
+            pos = chunk.rfind(delimiter, min_position + 1)
+            if pos != -1:
                 return pos + len(delimiter)
         
         return max_size
 
 
+class PooledRequests:
+    """
+    Stand-in for the requests module used by deep_translator.google.
+    
+    GoogleTranslator calls requests.get() for every translation, which
+    opens a new connection (TCP + TLS handshake) each time. This routes
+    those calls through one keep-alive requests.Session per thread and
+    forwards everything else to the real module.
+    """
+    
+    def __init__(self):
+        """Initialize per-thread session storage."""
+        self._local = threading.local()
+    
+    @property
+    def session(self) -> requests.Session:
+        """Session of the current thread, as sessions aren't thread-safe."""
+        session = getattr(self._local, 'session', None)
+        
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        
+        return session
+    
+    def get(self, *args: Any, **kwargs: Any) -> requests.Response:
+        """Send a GET request over the current thread's session."""
+        return self.session.get(*args, **kwargs)
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(requests, name)
+    
+    @classmethod
+    def install(cls) -> None:
+        """Make deep_translator's Google backend use pooled connections."""
+        if not isinstance(deep_translator.google.requests, cls):
+            deep_translator.google.requests = cls()
+
+
+class RateLimiter:
+    """
+    Paces requests across threads to a shared rate.
+    
+    The rate is halved whenever the service reports rate limiting and
+    grows back by config.RATE_INCREASE after each successful request.
+    """
+    
+    def __init__(self, rate_per_sec: float = config.REQUESTS_PER_SECOND):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            rate_per_sec: Maximum sustained requests per second
+        """
+        self.max_rate = rate_per_sec
+        self.rate = rate_per_sec
+        self._lock = threading.Lock()
+        self._next = 0.0
+    
+    def acquire(self) -> None:
+        """Block until the next HTTP request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + 1 / self.rate
+        
+        # Sleep outside the lock so other threads can reserve later slots
+        if wait > 0:
+            time.sleep(wait)
+    
+    def backoff(self) -> None:
+        """Halve the rate after the service reported rate limiting."""
+        with self._lock:
+            self.rate = max(config.MIN_REQUESTS_PER_SECOND, self.rate / 2)
+    
+    def recover(self) -> None:
+        """Raise the rate slightly after a successful request."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + config.RATE_INCREASE)
+
+
 class Translator:
     """Handles translation operations with retry logic."""
     
-    def __init__(self):
-        """Initialize translator."""
-        self.translator = GoogleTranslator(
-            source=config.SOURCE_LANGUAGE,
-            target=config.TARGET_LANGUAGE
-        )
+    def __init__(
+        self,
+        cache_path: Optional[Path] = config.CACHE_FILE,
+        limiter: Optional[RateLimiter] = None
+    ):
+        """
+        Initialize translator.
+        
+        Args:
+            cache_path: File used to persist translations between runs,
+                or None to keep the cache in memory only
+            limiter: Rate limiter to share with other translators
+        """
+        PooledRequests.install()
+        
+        self._local = threading.local()
+        self._limiter = limiter or RateLimiter()
+        self._request_slots = threading.Semaphore(config.MAX_WORKERS)
+        self.cache_path = cache_path
+        self._cache: Dict[str, str] = self._load_cache()
+        self._cache_size = len(self._cache)
+        
+        if cache_path is not None:
+            atexit.register(self.save_cache)
+    
+    @property
+    def translator(self) -> GoogleTranslator:
+        """Per-thread GoogleTranslator, as its HTTP handling isn't thread-safe."""
+        translator = getattr(self._local, 'translator', None)
+        
+        if translator is None:
+            translator = GoogleTranslator(
+                source=config.SOURCE_LANGUAGE,
+                target=config.TARGET_LANGUAGE
+            )
+            self._local.translator = translator
+        
+        return translator
     
-    def translate(self, text: str, verbose: bool = True) -> str:
+    def _load_cache(self) -> Dict[str, str]:
+        """Load previously saved translations, ignoring a cache for other languages."""
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        
+        try:
+            cache = json_io.read_file(self.cache_path)
+        except (OSError, ValueError):
+            return {}
+        
+        # Translations saved for another language pair would be wrong here
+        if (not isinstance(cache, dict)
+                or cache.get('source') != config.SOURCE_LANGUAGE
+                or cache.get('target') != config.TARGET_LANGUAGE):
+            return {}
+        
+        translations = cache.get('translations')
+        if not isinstance(translations, dict):
+            return {}
+        
+        # Drop hand-edited or corrupt entries rather than writing them into the data
+        return {
+            text: translated for text, translated in translations.items()
+            if isinstance(translated, str)
+        }
+    
+    def save_cache(self) -> None:
+        """Write the translation cache to disk if it has new entries."""
+        if self.cache_path is None or len(self._cache) == self._cache_size:
+            return
+        
+        json_io.write_file(self.cache_path, {
+            'source': config.SOURCE_LANGUAGE,
+            'target': config.TARGET_LANGUAGE,
+            'translations': self._cache,
+        })
+        
+        self._cache_size = len(self._cache)
+    
+    def translate(self, text: str) -> str:
         """
         Translate text with automatic chunking and retry logic.
         
         Args:
             text: Text to translate
-            verbose: Whether to print progress messages
             
         Returns:
             Translated text
@@ -119,65 +297,133 @@ class Translator:
         if not text or not isinstance(text, str) or not text.strip():
             return text
         
+        if text in self._cache:
+            return self._cache[text]
+        
         chunks = TextChunker.chunk_text(text)
         
         if len(chunks) == 1:
-            return self._translate_single(text, verbose)
+            result = self._translate_single(text)
         else:
-            return self._translate_chunks(chunks, verbose)
+            result = self._translate_chunks(chunks)
+        
+        # Failed translations come back unchanged; don't cache those so
+        # a later retry gets another chance
+        if result != text:
+            self._cache[text] = result
+        
+        return result
     
-    def _translate_single(self, text: str, verbose: bool) -> str:
+    def _translate_single(self, text: str) -> str:
         """Translate a single chunk of text."""
+        debug = log.isEnabledFor(logging.DEBUG)
+        
         for attempt in range(config.MAX_RETRIES):
             try:
-                result = self.translator.translate(text)
-                time.sleep(config.BASE_DELAY)
-                return result
+                return self._request(self.translator.translate, text)
             except Exception as e:
-                if verbose:
-                    print(f"    ⚠ Attempt {attempt + 1}/{config.MAX_RETRIES} failed: {str(e)[:50]}")
+                if debug:
+                    log.debug(f"    ⚠ Attempt {attempt + 1}/{config.MAX_RETRIES} failed: {str(e)[:50]}")
                 
                 if attempt < config.MAX_RETRIES - 1:
-                    time.sleep(config.RETRY_DELAY)
+                    time.sleep(self._retry_delay(e, attempt))
                 else:
-                    if verbose:
-                        print(f"    ✗ Failed after {config.MAX_RETRIES} attempts")
+                    if debug:
+                        log.debug(f"    ✗ Failed after {config.MAX_RETRIES} attempts")
                     return text
         
         return text
     
-    def _translate_chunks(self, chunks: List[str], verbose: bool) -> str:
+    def _translate_chunks(self, chunks: List[str]) -> str:
         """Translate multiple chunks of text."""
-        if verbose:
-            print(f"    📦 Splitting into {len(chunks)} chunks...")
+        debug = log.isEnabledFor(logging.DEBUG)
+        
+        if debug:
+            log.debug(f"    📦 Splitting into {len(chunks)} chunks...")
         
         translated_chunks: List[str] = []
         
         for i, chunk in enumerate(chunks):
             for attempt in range(config.MAX_RETRIES):
                 try:
-                    result = self.translator.translate(chunk)
+                    result = self._request(self.translator.translate, chunk)
                     translated_chunks.append(result)
                     
-                    if verbose:
-                        print(f"    ✓ Chunk {i+1}/{len(chunks)} translated")
+                    if debug:
+                        log.debug(f"    ✓ Chunk {i+1}/{len(chunks)} translated")
                     
-                    time.sleep(config.CHUNK_DELAY)
                     break
                     
                 except Exception as e:
-                    if verbose:
-                        print(f"    ⚠ Chunk {i+1} attempt {attempt + 1} failed")
+                    if debug:
+                        log.debug(f"    ⚠ Chunk {i+1} attempt {attempt + 1} failed")
                     
                     if attempt < config.MAX_RETRIES - 1:
-                        time.sleep(config.RETRY_DELAY)
+                        time.sleep(self._retry_delay(e, attempt))
                     else:
-                        if verbose:
-                            print(f"    ✗ Chunk {i+1} failed, using original")
+                        if debug:
+                            log.debug(f"    ✗ Chunk {i+1} failed, using original")
                         translated_chunks.append(chunk)
                         break
         
         return ' '.join(translated_chunks)
+    
+    def _request(self, method: Callable[[Any], Any], payload: Any) -> Any:
+        """Send one HTTP request to the translation service, paced by the shared rate limiter."""
+        self._limiter.acquire()
+        
+        try:
+            with self._request_slots:
+                result = method(payload)
+        except TooManyRequests:
+            self._limiter.backoff()
+            raise
+        
+        self._limiter.recover()
+        return result
+    
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """Delay before the next attempt; back off exponentially when rate limited."""
+        if isinstance(error, TooManyRequests):
+            return config.RETRY_DELAY * (2 ** attempt)
+        return config.RETRY_DELAY
+    
+    def translate_many(self, texts: List[str]) -> List[str]:
+        """
+        Translate many texts, sending each distinct uncached text only once.
+        
+        Every text goes through translate(), so each one is retried on its
+        own and a text that keeps failing never causes the others to be
+        sent again.
+        
+        Args:
+            texts: Texts to translate
+        
+        Returns:
+            Translated texts, in the same order as the input
+        """
+        results: List[str] = list(texts)
+        
+        # Positions of every text still needing translation, keyed by text
+        # so duplicates are only sent once
+        positions: Dict[str, List[int]] = {}
+        
+        for i, text in enumerate(texts):
+            if not text or not isinstance(text, str) or not text.strip():
+                continue
+            
+            if text in self._cache:
+                results[i] = self._cache[text]
+            else:
+                positions.setdefault(text, []).append(i)
+        
+        for text, indices in positions.items():
+            translated = self.translate(text)
+            for i in indices:
+                results[i] = translated
+        
+        return results
 
 
 class JSONTranslator:
@@ -205,89 +451,241 @@ class JSONTranslator:
         """
         stats = TranslationStats()
         
-        try:
-            if verbose:
-                print(f"\n{'='*60}")
-                print(f"Processing: {file_path.name}")
-                print(f"{'='*60}")
-            
-            # Load JSON data
-            with open(file_path, 'r', encoding=config.ENCODING) as f:
-                data: List[Dict[str, Any]] = json.load(f)
-            
-            stats.total_items = len(data)
-            
-            if verbose:
-                print(f"Found {stats.total_items} items to process")
-            
-            # Process each item
-            for i, item in enumerate(data):
+        with BufferedProgress() as progress:
+            try:
                 if verbose:
-                    print(f"\n[{i + 1}/{stats.total_items}] Processing item...")
+                    progress.write(f"\n{'='*60}")
+                    progress.write(f"Processing: {file_path.name}")
+                    progress.write(f"{'='*60}")
                 
-                self._process_item(item, stats, verbose)
-            
-            # Save updated JSON
-            with open(file_path, 'w', encoding=config.ENCODING) as f:
-                json.dump(data, f, ensure_ascii=False, indent=config.JSON_INDENT)
-            
-            if verbose:
-                print(f"\n✓ Successfully processed: {file_path.name}")
-                print(f"  {stats}")
+                pending_file = self.load_file(file_path)
+                stats = pending_file.stats
+                
+                # Translate everything collected in as few requests as possible
+                unique_values = list(dict.fromkeys(value for _, _, value in pending_file.fields))
+                
+                if verbose:
+                    progress.write(f"Found {stats.total_items} items to process")
+                    if unique_values:
+                        progress.write(f"\nTranslating {len(unique_values)} unique values "
+                                       f"({len(pending_file.fields)} fields)...")
+                
+                # Show what is happening before the slow part starts
+                progress.flush()
+                
+                translations = dict(zip(unique_values, self.translator.translate_many(unique_values)))
+                self.save_file(pending_file, translations)
+                
+                if verbose:
+                    progress.write(f"\n✓ Successfully processed: {file_path.name}")
+                    progress.write(f"  {stats}")
+                
+                return FileResult(
+                    filename=file_path.name,
+                    success=True,
+                    stats=stats
+                )
+                
+            except Exception as e:
+                result = self.error_result(file_path, stats, e)
+                if verbose:
+                    progress.write(f"\n✗ {result.error}")
+                
+                return result
+    
+    def load_file(self, file_path: Path) -> PendingFile:
+        """
+        Load a JSON file and queue its untranslated fields.
+        
+        Args:
+            file_path: Path to JSON file
             
-            return FileResult(
-                filename=file_path.name,
-                success=True,
-                stats=stats
-            )
+        Returns:
+            PendingFile holding the parsed data and queued fields
+        """
+        raw = file_path.read_bytes()
+        data: List[Dict[str, Any]] = json_io.loads(raw)
+        
+        pending_file = PendingFile(
+            path=file_path,
+            raw=raw,
+            data=data,
+            stats=TranslationStats(total_items=len(data))
+        )
+        
+        debug = log.isEnabledFor(logging.DEBUG)
+        
+        for i, item in enumerate(data):
+            if debug:
+                log.debug(f"[{i + 1}/{len(data)}] Processing item...")
             
-        except Exception as e:
-            error_msg = f"Error processing {file_path.name}: {str(e)}"
-            if verbose:
-                print(f"\n✗ {error_msg}")
+            self._process_item(item, pending_file.stats, pending_file.fields)
+        
+        return pending_file
+    
+    def save_file(
+        self,
+        pending_file: PendingFile,
+        translations: Dict[str, str]
+    ) -> None:
+        """
+        Store translations for the queued fields and write the file back.
+        
+        Args:
+            pending_file: File returned by load_file()
+            translations: Translation for every queued value
+        """
+        stats = pending_file.stats
+        debug = log.isEnabledFor(logging.DEBUG)
+        
+        for item, en_key, value in pending_file.fields:
+            translated = translations[value]
+            item[en_key] = translated
             
-            return FileResult(
-                filename=file_path.name,
-                success=False,
-                stats=stats,
-                error=error_msg
-            )
+            if translated != value:
+                stats.translated_fields += 1
+            else:
+                stats.failed_fields += 1
+                if debug:
+                    log.debug(f"  ⚠ '{en_key}' (translation may have failed)")
+        
+        # Save updated JSON, leaving fully translated files untouched
+        if pending_file.fields:
+            json_io.write_file_if_changed(pending_file.path, pending_file.data, pending_file.raw)
     
-    def _process_item(self, item: Dict[str, Any], stats: TranslationStats, verbose: bool) -> None:
-        """Process a single item in the JSON array."""
-        for key, value in list(item.items()):
-            # Skip if already translated or not a string
-            if key.endswith(config.TRANSLATION_SUFFIX):
-                continue
+    @staticmethod
+    def error_result(file_path: Path, stats: TranslationStats, error: Exception) -> FileResult:
+        """Build the FileResult for a file that could not be processed."""
+        return FileResult(
+            filename=file_path.name,
+            success=False,
+            stats=stats,
+            error=f"Error processing {file_path.name}: {str(error)}"
+        )
+    
+    def _process_item(
+        self,
+        item: Dict[str, Any],
+        stats: TranslationStats,
+        pending: List[Tuple[Dict[str, Any], str, str]]
+    ) -> None:
+        """Queue the untranslated fields of a single item in the JSON array."""
+        debug = log.isEnabledFor(logging.DEBUG)
+        
+        # Only original fields; keys added below are never revisited
+        source_keys = tuple(k for k in item if k[-TRANSLATION_SUFFIX_LEN:] != TRANSLATION_SUFFIX)
+        
+        for key in source_keys:
+            value = item[key]
             
             if not isinstance(value, str) or not value.strip():
                 continue
             
-            en_key = f"{key}{config.TRANSLATION_SUFFIX}"
+            en_key = key + TRANSLATION_SUFFIX
             
             # Check if already has translation
             if en_key in item:
                 stats.skipped_fields += 1
-                if verbose:
-                    print(f"  Skipping '{key}' (already translated)")
+                if debug:
+                    log.debug(f"  Skipping '{key}' (already translated)")
                 continue
             
-            # Translate the field
-            if verbose:
-                print(f"  Translating '{key}' ({len(value)} chars)...", end=' ')
-                sys.stdout.flush()
+            if debug:
+                log.debug(f"  Queued '{key}' ({len(value)} chars)")
             
-            translated = self.translator.translate(value, verbose=False)
-            item[en_key] = translated
+            # Interned so every item shares one key object for the new field
+            pending.append((item, sys.intern(en_key), value))
+
+
+class TranslationPipeline:
+    """
+    Translates many files in three phases so batching and deduplication
+    span all of them:
+    
+    1. Load every file and collect the unique untranslated values
+    2. Translate those values in concurrent batches
+    3. Fill in the translations and write each file back
+    """
+    
+    def __init__(self, json_translator: JSONTranslator, max_workers: int = config.MAX_WORKERS):
+        """
+        Initialize pipeline.
+        
+        Args:
+            json_translator: JSONTranslator used to load and save files
+            max_workers: Maximum number of concurrent translation batches
+        """
+        self.json_translator = json_translator
+        self.max_workers = max_workers
+        self.sources: Set[str] = set()
+        self.plan: List[PendingFile] = []
+    
+    def run(self, json_files: List[Path]) -> List[FileResult]:
+        """
+        Translate all given files.
+        
+        Args:
+            json_files: Paths to JSON files
             
-            if translated != value:
-                stats.translated_fields += 1
-                if verbose:
-                    print(f"✓ ({len(translated)} chars)")
-            else:
-                stats.failed_fields += 1
-                if verbose:
-                    print(f"⚠ (translation may have failed)")
+        Returns:
+            FileResult for every file, in input order
+        """
+        results: Dict[Path, FileResult] = {}
+        
+        # Phase 1: collect
+        for file_path in json_files:
+            try:
+                pending_file = self.json_translator.load_file(file_path)
+            except Exception as e:
+                results[file_path] = self.json_translator.error_result(file_path, TranslationStats(), e)
+                continue
+            
+            self.plan.append(pending_file)
+            self.sources.update(value for _, _, value in pending_file.fields)
+        
+        print(f"Collected {len(self.sources)} unique values from {len(self.plan)} files")
+        
+        # Phase 2: translate
+        translations = self._translate(sorted(self.sources))
+        
+        # Phase 3: write
+        for pending_file in self.plan:
+            try:
+                self.json_translator.save_file(pending_file, translations)
+                results[pending_file.path] = FileResult(
+                    filename=pending_file.path.name,
+                    success=True,
+                    stats=pending_file.stats
+                )
+            except Exception as e:
+                results[pending_file.path] = self.json_translator.error_result(
+                    pending_file.path, pending_file.stats, e
+                )
+        
+        return [results[file_path] for file_path in json_files]
+    
+    def _translate(self, texts: List[str]) -> Dict[str, str]:
+        """Translate texts in groups of config.BATCH_SIZE across worker threads."""
+        translate_many = self.json_translator.translator.translate_many
+        groups = [texts[i:i + config.BATCH_SIZE] for i in range(0, len(texts), config.BATCH_SIZE)]
+        translations: Dict[str, str] = {}
+        
+        # One progress update per finished group rather than per field
+        progress = tqdm(
+            total=len(texts), desc="Translating", unit="text",
+            mininterval=config.PROGRESS_FLUSH_INTERVAL
+        ) if tqdm else None
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for group, translated in zip(groups, executor.map(translate_many, groups)):
+                translations.update(zip(group, translated))
+                if progress is not None:
+                    progress.update(len(group))
+        
+        if progress is not None:
+            progress.close()
+        
+        return translations
 
 
 def process_files(json_dir: Path, max_workers: int = config.MAX_WORKERS) -> None:
@@ -313,28 +711,26 @@ def process_files(json_dir: Path, max_workers: int = config.MAX_WORKERS) -> None
     print("✓ Translator ready\n")
     
     # Find all JSON files
-    json_files = sorted(json_dir.glob('*.json'))
+    json_files = list(json_io.walk_json_files(json_dir))
     print(f"Found {len(json_files)} JSON files to process\n")
     
     if not json_files:
         print("No JSON files found!")
         return
     
-    # Process files
-    results: List[FileResult] = []
-    
     print(f"{'#'*70}")
     print(f"PROCESSING FILES")
     print(f"{'#'*70}")
     
-    # Process sequentially to maintain order and avoid rate limiting
-    for idx, json_file in enumerate(json_files, 1):
-        print(f"\n{'─'*70}")
-        print(f"FILE {idx}/{len(json_files)}")
-        print(f"{'─'*70}")
-        
-        result = json_translator.process_file(json_file, verbose=True)
-        results.append(result)
+    # Translate all files together so batches and deduplication span files
+    pipeline = TranslationPipeline(json_translator, max_workers)
+    results: List[FileResult] = pipeline.run(json_files)
+    
+    with BufferedProgress() as progress:
+        for idx, result in enumerate(results, 1):
+            status = "✓" if result.success else "✗"
+            progress.write(f"\n[{idx}/{len(json_files)}] {status} {result.filename}")
+            progress.write(f"  {result.error or result.stats}")
     
     # Print summary
     print_summary(results)
@@ -372,6 +768,7 @@ def print_summary(results: List[FileResult]) -> None:
 
 def main() -> None:
     """Main entry point."""
+    logging.basicConfig(level=config.LOG_LEVEL, format='%(message)s')
     process_files(config.JSON_DIR)
 
 
@@ -0,0 +1,64 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled Field Counting Kernel
+Optional Cython version of the per-field loop in verify_translations.py.
+
+Build in place with:
+    cythonize -i verify_core.pyx
+
+verify_translations.py falls back to its pure-Python implementation when
+this module has not been built.
+"""
+
+from cpython.dict cimport PyDict_GetItem, PyDict_Next
+from cpython.object cimport PyObject
+from cpython.unicode cimport PyUnicode_Tailmatch
+
+
+def count_fields(list data, str suffix):
+    """
+    Count original, translated and failed fields in parsed file data.
+
+    Args:
+        data: List of item dicts
+        suffix: Suffix marking translated keys
+
+    Returns:
+        (total_fields, translated_fields, failed_fields)
+    """
+    cdef Py_ssize_t total_fields = 0
+    cdef Py_ssize_t translated_fields = 0
+    cdef Py_ssize_t failed_fields = 0
+    cdef Py_ssize_t pos
+    cdef PyObject *key_ptr
+    cdef PyObject *value_ptr
+    cdef PyObject *translation_ptr
+    cdef object item, key, value
+
+    for item in data:
+        if type(item) is not dict:
+            raise TypeError(f"Expected dict items, got {type(item).__name__}")
+
+        pos = 0
+        # Walk the dict in place without building (key, value) tuples
+        while PyDict_Next(item, &pos, &key_ptr, &value_ptr):
+            key = <object>key_ptr
+
+            # Only count original (non-translated) string fields
+            if PyUnicode_Tailmatch(key, suffix, 0, len(key), 1):
+                continue
+
+            value = <object>value_ptr
+            if type(value) is not str or not (<str>value).strip():
+                continue
+
+            total_fields += 1
+            translation_ptr = PyDict_GetItem(item, key + suffix)
+
+            if translation_ptr is not NULL:
+                translated_fields += 1
+                # Check if translation failed (same as original)
+                if <object>translation_ptr == value:
+                    failed_fields += 1
+
+    return total_fields, translated_fields, failed_fields
@@ -9,17 +9,43 @@ Features:
 - Identifies failed translations (same as original)
 - Colored output for better readability
 - Exports summary to markdown report
+- Optional compiled counting kernel (verify_core.pyx)
+- Streams very large files when ijson is installed
 """
 
-import json
-from dataclasses import dataclass
+import multiprocessing
+import operator
+import os
+import sys
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import config
+from config import TRANSLATION_SUFFIX
+import json_io
+from progress import BufferedProgress
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-@dataclass
+# Stands in for an absent translation key (a translation may itself be null)
+_MISSING = object()
+
+# Heading of the per-file table in the markdown report
+_REPORT_TABLE_HEADER = (
+    "| File | Items | Fields | Translated | Failed | Success Rate |\n"
+    "|------|-------|--------|------------|--------|-------------|"
+)
+
+
+@dataclass(slots=True, frozen=True)
 class FileStats:
     """Statistics for a single file."""
     filename: str
@@ -27,13 +53,19 @@ class FileStats:
     total_fields: int
     translated_fields: int
     failed_fields: int
+    _rate: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Computed once; the rate is read for the console and the report
+        rate = 0.0
+        if self.total_fields:
+            rate = (self.translated_fields - self.failed_fields) / self.total_fields * 100
+        object.__setattr__(self, '_rate', rate)
     
     @property
     def translation_rate(self) -> float:
         """Calculate translation success rate."""
-        if self.total_fields == 0:
-            return 0.0
-        return (self.translated_fields - self.failed_fields) / self.total_fields * 100
+        return self._rate
     
     @property
     def is_complete(self) -> bool:
@@ -41,7 +73,7 @@ class FileStats:
         return self.translated_fields == self.total_fields and self.failed_fields == 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AggregateStats:
     """Aggregate statistics across all files."""
     total_files: int
@@ -50,20 +82,314 @@ class AggregateStats:
     translated_fields: int
     failed_fields: int
     file_stats: List[FileStats]
+    needs_attention: List[FileStats] = field(default_factory=list)  # Files with failed translations
+    _coverage_rate: float = field(init=False, repr=False, compare=False)
+    _translation_rate: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Computed once; both rates are read for the console and the report
+        coverage_rate = translation_rate = 0.0
+        if self.total_fields:
+            coverage_rate = (self.translated_fields - self.failed_fields) / self.total_fields * 100
+            translation_rate = self.translated_fields / self.total_fields * 100
+        object.__setattr__(self, '_coverage_rate', coverage_rate)
+        object.__setattr__(self, '_translation_rate', translation_rate)
     
     @property
     def coverage_rate(self) -> float:
         """Calculate overall translation coverage."""
-        if self.total_fields == 0:
-            return 0.0
-        return (self.translated_fields - self.failed_fields) / self.total_fields * 100
+        return self._coverage_rate
     
     @property
     def translation_rate(self) -> float:
         """Calculate translation attempt rate."""
-        if self.total_fields == 0:
-            return 0.0
-        return self.translated_fields / self.total_fields * 100
+        return self._translation_rate
+
+
+def _count_fields(data: List[Dict[str, Any]], suffix: str) -> Tuple[int, int, int]:
+    """
+    Count original, translated and failed fields in parsed file data.
+    
+    Pure-Python version of verify_core.count_fields, used when the compiled
+    module has not been built.
+    
+    Args:
+        data: List of item dicts
+        suffix: Suffix marking translated keys
+        
+    Returns:
+        (total_fields, translated_fields, failed_fields)
+    """
+    # Gather the fields into two parallel columns: each original value and
+    # its translation (or _MISSING), so the counting runs as C-level passes
+    originals: List[str] = []
+    translations: List[Any] = []
+    add_original = originals.append
+    add_translation = translations.append
+    
+    # Local binding keeps the length out of the per-field loop
+    suffix_len = len(suffix)
+    
+    for item in data:
+        # Match verify_core: items must be objects, not lists or scalars
+        if type(item) is not dict:
+            raise TypeError(f"Expected dict items, got {type(item).__name__}")
+        
+        # Translations keyed by the field they translate, so each original
+        # needs one lookup and no key concatenation
+        get_translation = {
+            key[:-suffix_len]: item[key] for key in item if key[-suffix_len:] == suffix
+        }.get
+        
+        # Iterating keys avoids packing a (key, value) tuple per field
+        for key in item:
+            # Only count original (non-translated) non-empty string fields
+            if key[-suffix_len:] == suffix:
+                continue
+            
+            value = item[key]
+            if isinstance(value, str) and value.strip():
+                add_original(value)
+                add_translation(get_translation(key, _MISSING))
+    
+    total_fields = len(originals)
+    translated_fields = total_fields - translations.count(_MISSING)
+    # A translation failed if it is the same as the original
+    failed_fields = sum(map(operator.eq, originals, translations))
+    
+    return total_fields, translated_fields, failed_fields
+
+
+try:
+    from verify_core import count_fields
+except ImportError:
+    count_fields = _count_fields
+
+
+def _verify_data(filename: str, raw: bytes) -> FileStats:
+    """
+    Verify translation status of a single file.
+    
+    Args:
+        filename: Name of the JSON file
+        raw: Raw contents of the file
+        
+    Returns:
+        FileStats with verification results
+    """
+    data = json_io.loads(raw)
+    
+    # Skip if not a list (e.g., mapping files)
+    if not isinstance(data, list):
+        raise ValueError(f"Expected list, got {type(data).__name__}")
+    
+    total_fields, translated_fields, failed_fields = count_fields(data, TRANSLATION_SUFFIX)
+    
+    return FileStats(
+        filename=filename,
+        total_items=len(data),
+        total_fields=total_fields,
+        translated_fields=translated_fields,
+        failed_fields=failed_fields
+    )
+
+
+def _verify_stream(file_path: Path) -> FileStats:
+    """
+    Verify translation status of a large file by stream-parsing it.
+    
+    Only config.STREAM_BATCH_SIZE items are held in memory at a time.
+    
+    Args:
+        file_path: Path to JSON file
+        
+    Returns:
+        FileStats with verification results
+    """
+    total_items = 0
+    total_fields = 0
+    translated_fields = 0
+    failed_fields = 0
+    
+    with open(file_path, 'rb') as f:
+        # ijson silently yields no items for a non-array document
+        if not f.read(64).lstrip().startswith(b'['):
+            raise ValueError("Expected list")
+        f.seek(0)
+        
+        items = ijson.items(f, 'item')
+        while True:
+            batch = list(islice(items, config.STREAM_BATCH_SIZE))
+            if not batch:
+                break
+            
+            fields, translated, failed = count_fields(batch, TRANSLATION_SUFFIX)
+            total_items += len(batch)
+            total_fields += fields
+            translated_fields += translated
+            failed_fields += failed
+    
+    return FileStats(
+        filename=file_path.name,
+        total_items=total_items,
+        total_fields=total_fields,
+        translated_fields=translated_fields,
+        failed_fields=failed_fields
+    )
+
+
+def _verify_file_worker(filename: str, source: Union[bytes, Path]) -> Tuple[Optional[FileStats], Optional[str]]:
+    """
+    Process pool entry point for verifying a single file.
+    
+    Args:
+        filename: Name of the JSON file
+        source: Raw contents of the file, or its path to stream-parse it
+        
+    Returns:
+        (FileStats, None) on success or (None, error message) on failure
+    """
+    try:
+        if isinstance(source, Path):
+            return _verify_stream(source), None
+        return _verify_data(filename, source), None
+    except Exception as e:
+        return None, f"✗ Error reading {filename}: {e}"
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """
+    Start method for the verification process pool.
+    
+    The reader threads are already running when the first worker starts, and
+    forking a threaded process can deadlock, so workers come from a fork
+    server (or are spawned where that is unavailable) instead.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def _file_size(file_path: Path) -> int:
+    """Return the size of a file, or 0 if it cannot be read."""
+    try:
+        return os.stat(file_path).st_size
+    except OSError:
+        return 0
+
+
+def _completed(result: Tuple[Optional[FileStats], Optional[str]]) -> Future:
+    """Wrap an already known result so it queues alongside pending ones."""
+    future: Future = Future()
+    future.set_result(result)
+    return future
+
+
+def _submit_inline(fn: Callable[..., Any], *args: Any) -> Future:
+    """Run a job in the calling process, returning its result as a Future."""
+    return _completed(fn(*args))
+
+
+class VerificationCache:
+    """Remembers FileStats per file, keyed on the file's mtime and size."""
+    
+    def __init__(self, json_dir: Path):
+        """
+        Initialize cache and load any saved results.
+        
+        Args:
+            json_dir: Directory containing JSON files
+        """
+        self.cache_path = json_dir / config.VERIFY_CACHE_FILE
+        self._entries: Dict[str, Dict[str, List[int]]] = self._load()
+        self._fingerprints: Dict[str, List[int]] = {}
+        self._dirty = False
+    
+    def _load(self) -> Dict[str, Dict[str, List[int]]]:
+        """Load saved results, ignoring a missing, unreadable or outdated cache."""
+        try:
+            cache = json_io.read_file(self.cache_path)
+        except (OSError, ValueError):
+            return {}
+        
+        # Counts depend on the suffix, so results saved for another one are useless
+        if not isinstance(cache, dict) or cache.get('suffix') != config.TRANSLATION_SUFFIX:
+            return {}
+        
+        files = cache.get('files')
+        return files if isinstance(files, dict) else {}
+    
+    def lookup(self, file_path: Path) -> Optional[FileStats]:
+        """
+        Get saved results for the current version of a file.
+        
+        Also records the file's fingerprint for a later store().
+        
+        Args:
+            file_path: Path to JSON file
+            
+        Returns:
+            FileStats if the file is unchanged since it was last verified
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        
+        fingerprint = [st.st_mtime_ns, st.st_size]
+        self._fingerprints[file_path.name] = fingerprint
+        
+        entry = self._entries.get(file_path.name)
+        if not isinstance(entry, dict) or entry.get('fingerprint') != fingerprint:
+            return None
+        
+        # The cache is only an optimisation, so a malformed entry is a miss
+        counts = entry.get('stats')
+        if (not isinstance(counts, list) or len(counts) != 4
+                or not all(type(count) is int for count in counts)):
+            return None
+        
+        return FileStats(file_path.name, *counts)
+    
+    def store(self, stats: FileStats) -> None:
+        """
+        Save results for the version of a file seen by lookup().
+        
+        Args:
+            stats: Verification results of the file
+        """
+        fingerprint = self._fingerprints.get(stats.filename)
+        if fingerprint is None:
+            return
+        
+        self._entries[stats.filename] = {
+            'fingerprint': fingerprint,
+            'stats': [stats.total_items, stats.total_fields,
+                      stats.translated_fields, stats.failed_fields],
+        }
+        self._dirty = True
+    
+    def save(self) -> None:
+        """
+        Write cache to disk if anything changed.
+        
+        Only files looked up during this run are kept, so entries for
+        deleted or renamed files are pruned.
+        """
+        seen = {
+            name: entry for name, entry in self._entries.items()
+            if name in self._fingerprints
+        }
+        if len(seen) != len(self._entries):
+            self._entries = seen
+            self._dirty = True
+        
+        if self._dirty:
+            json_io.write_file(self.cache_path, {
+                'suffix': config.TRANSLATION_SUFFIX,
+                'files': self._entries,
+            })
+            self._dirty = False
 
 
 class TranslationVerifier:
@@ -77,6 +403,7 @@ class TranslationVerifier:
             json_dir: Directory containing JSON files
         """
         self.json_dir = json_dir
+        self.cache = VerificationCache(json_dir)
     
     def verify_all_files(self) -> AggregateStats:
         """
@@ -85,8 +412,19 @@ class TranslationVerifier:
         Returns:
             AggregateStats with verification results
         """
-        json_files = sorted(self.json_dir.glob('*.json'))
-        file_stats: List[FileStats] = []
+        return aggregate(self.iter_verify())
+    
+    def iter_verify(self) -> Iterator[FileStats]:
+        """
+        Verify all JSON files in directory, yielding results as they arrive.
+        
+        Per-file status lines and read errors are printed along the way, and
+        the results cache is saved once iteration stops.
+        
+        Yields:
+            FileStats per verified file, in file name order
+        """
+        json_files = json_io.list_json_files(self.json_dir)
         
         print("="*70)
         print("TRANSLATION VERIFICATION REPORT")
@@ -96,169 +434,225 @@ class TranslationVerifier:
         print("="*70)
         print()
         
-        total_items = 0
-        total_fields = 0
-        translated_fields = 0
-        failed_fields = 0
-        
-        for json_file in json_files:
-            # Skip metadata files
-            if json_file.name in ('filename_mapping.json',):
-                continue
-                
-            try:
-                stats = self._verify_file(json_file)
-                file_stats.append(stats)
-                
-                total_items += stats.total_items
-                total_fields += stats.total_fields
-                translated_fields += stats.translated_fields
-                failed_fields += stats.failed_fields
-                
-                # Print file status
-                status = "✓" if stats.is_complete else "⚠"
-                print(f"{status} {stats.filename}")
-                print(f"   Items: {stats.total_items}, Fields: {stats.total_fields}, "
-                      f"Translated: {stats.translated_fields}, Failed: {stats.failed_fields} "
-                      f"({stats.translation_rate:.1f}% success)")
-                
-            except Exception as e:
-                print(f"✗ Error reading {json_file.name}: {e}")
-        
-        return AggregateStats(
-            total_files=len(file_stats),
-            total_items=total_items,
-            total_fields=total_fields,
-            translated_fields=translated_fields,
-            failed_fields=failed_fields,
-            file_stats=file_stats
-        )
+        # Per-file lines are batched into a few large writes
+        try:
+            with BufferedProgress() as progress:
+                for stats, error in self._iter_results(json_files):
+                    if error:
+                        progress.write(error)
+                        continue
+                    
+                    # Record file status
+                    status = "✓" if stats.is_complete else "⚠"
+                    progress.write(f"{status} {stats.filename}")
+                    progress.write(f"   Items: {stats.total_items}, Fields: {stats.total_fields}, "
+                                   f"Translated: {stats.translated_fields}, Failed: {stats.failed_fields} "
+                                   f"({stats.translation_rate:.1f}% success)")
+                    
+                    yield stats
+        finally:
+            self.cache.save()
     
-    def _verify_file(self, file_path: Path) -> FileStats:
+    def _iter_results(self, json_files: List[Path]) -> Iterator[Tuple[Optional[FileStats], Optional[str]]]:
         """
-        Verify translation status of a single file.
+        Verify files in order, overlapping disk reads with parsing.
+        
+        Files unchanged since the last run reuse their cached results. For the
+        rest, a thread pool keeps up to config.READ_AHEAD files read ahead while
+        a process pool parses and counts the files already in memory.
         
         Args:
-            file_path: Path to JSON file
+            json_files: Data files to verify, without metadata files
             
-        Returns:
-            FileStats with verification results
+        Yields:
+            (FileStats, None) per verified file or (None, error message)
         """
-        with open(file_path, 'r', encoding=config.ENCODING) as f:
-            data = json.load(f)
-        
-        # Skip if not a list (e.g., mapping files)
-        if not isinstance(data, list):
-            raise ValueError(f"Expected list, got {type(data).__name__}")
-        
-        total_fields = 0
-        translated_fields = 0
-        failed_fields = 0
-        
-        for item in data:
-            for key, value in item.items():
-                # Only count original (non-translated) string fields
-                if key.endswith(config.TRANSLATION_SUFFIX):
-                    continue
-                
-                if not isinstance(value, str) or not value.strip():
-                    continue
+        if not json_files:
+            return
+        
+        # Files unchanged since the last run reuse their saved results
+        jobs = [(f, self.cache.lookup(f)) for f in json_files]
+        
+        # Large files are streamed by the workers instead of read ahead whole
+        streamed = {
+            f for f, cached in jobs
+            if cached is None and ijson is not None and _file_size(f) >= config.STREAM_MIN_BYTES
+        }
+        to_read = [f for f, cached in jobs if cached is None and f not in streamed]
+        
+        # Parsing is CPU-bound, so spread it over processes to side-step the GIL.
+        # With a single worker a pool would only add pickling, so parse in-process
+        workers = max(1, min(os.cpu_count() or 1, len(to_read) + len(streamed)))
+        pool = (
+            ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context())
+            if workers > 1 else nullcontext()
+        )
+        files = iter(to_read)
+        
+        with ThreadPoolExecutor(max_workers=config.READ_AHEAD) as reader, pool as executor:
+            submit = executor.submit if executor is not None else _submit_inline
+            reads: Deque[Future] = deque(
+                reader.submit(f.read_bytes) for f in islice(files, config.READ_AHEAD)
+            )
+            pending: Deque[Tuple[bool, Future]] = deque()
+            
+            for file_path, cached in jobs:
+                if cached is not None:
+                    job = (False, _completed((cached, None)))
+                elif file_path in streamed:
+                    job = (True, submit(_verify_file_worker, file_path.name, file_path))
+                else:
+                    read = reads.popleft()
+                    
+                    # Keep the read-ahead window full
+                    next_file = next(files, None)
+                    if next_file is not None:
+                        reads.append(reader.submit(next_file.read_bytes))
+                    
+                    try:
+                        raw = read.result()
+                    except OSError as e:
+                        job = (False, _completed((None, f"✗ Error reading {file_path.name}: {e}")))
+                    else:
+                        job = (True, submit(_verify_file_worker, file_path.name, raw))
                 
-                total_fields += 1
-                en_key = f"{key}{config.TRANSLATION_SUFFIX}"
+                pending.append(job)
                 
-                if en_key in item:
-                    translated_fields += 1
-                    # Check if translation failed (same as original)
-                    if item[en_key] == value:
-                        failed_fields += 1
-        
-        return FileStats(
-            filename=file_path.name,
-            total_items=len(data),
-            total_fields=total_fields,
-            translated_fields=translated_fields,
-            failed_fields=failed_fields
-        )
+                # Bound the number of parsed-but-unreported files held in memory
+                while len(pending) > 2 * workers:
+                    yield self._collect(*pending.popleft())
+            
+            while pending:
+                yield self._collect(*pending.popleft())
+    
+    def _collect(self, fresh: bool, future: Future) -> Tuple[Optional[FileStats], Optional[str]]:
+        """Wait for a file's result, saving freshly computed stats to the cache."""
+        stats, error = future.result()
+        if fresh and stats is not None:
+            self.cache.store(stats)
+        return stats, error
 
 
-def print_summary(stats: AggregateStats) -> None:
+def aggregate(file_stats_iter: Iterable[FileStats]) -> AggregateStats:
     """
-    Print summary statistics.
+    Combine per-file results into aggregate statistics.
     
     Args:
-        stats: Aggregate statistics to print
+        file_stats_iter: Per-file results, e.g. from TranslationVerifier.iter_verify
+        
+    Returns:
+        AggregateStats over all given files
     """
-    print()
-    print("="*70)
-    print("SUMMARY")
-    print("="*70)
-    print(f"Total files processed: {stats.total_files}")
-    print(f"Total items: {stats.total_items}")
-    print(f"Total text fields: {stats.total_fields}")
-    print(f"Successfully translated: {stats.translated_fields} ({stats.translation_rate:.1f}%)")
-    print(f"Failed translations: {stats.failed_fields} ({stats.failed_fields/stats.total_fields*100:.1f}%)")
-    print(f"Translation coverage: {stats.coverage_rate:.1f}%")
-    print("="*70)
-    
-    # Print files needing attention
-    needs_attention = [fs for fs in stats.file_stats if not fs.is_complete]
+    file_stats: List[FileStats] = []
+    needs_attention: List[FileStats] = []
     
-    if needs_attention:
-        print(f"\n⚠ Files with failed translations ({len(needs_attention)}):")
-        for fs in needs_attention:
-            print(f"  - {fs.filename}: {fs.failed_fields} failed")
+    total_items = 0
+    total_fields = 0
+    translated_fields = 0
+    failed_fields = 0
+    
+    for stats in file_stats_iter:
+        file_stats.append(stats)
+        
+        total_items += stats.total_items
+        total_fields += stats.total_fields
+        translated_fields += stats.translated_fields
+        failed_fields += stats.failed_fields
+        
+        if not stats.is_complete:
+            needs_attention.append(stats)
+    
+    return AggregateStats(
+        total_files=len(file_stats),
+        total_items=total_items,
+        total_fields=total_fields,
+        translated_fields=translated_fields,
+        failed_fields=failed_fields,
+        file_stats=file_stats,
+        needs_attention=needs_attention
+    )
 
 
-def export_markdown_report(stats: AggregateStats, output_path: Path) -> None:
+def render(stats: AggregateStats, md_path: Path) -> None:
     """
-    Export verification results to markdown file.
+    Print summary statistics and export them to a markdown report.
+    
+    Both outputs share a single pass over the per-file statistics and the
+    needs_attention list collected during verification, and each is
+    written in one call.
     
     Args:
-        stats: Aggregate statistics to export
-        output_path: Path to output markdown file
+        stats: Aggregate statistics to report
+        md_path: Path to output markdown file
     """
-    with open(output_path, 'w', encoding=config.ENCODING) as f:
-        f.write("# Translation Verification Report\n\n")
-        f.write(f"## Summary\n\n")
-        f.write(f"- **Total Files**: {stats.total_files}\n")
-        f.write(f"- **Total Items**: {stats.total_items}\n")
-        f.write(f"- **Total Fields**: {stats.total_fields}\n")
-        f.write(f"- **Translation Rate**: {stats.translation_rate:.1f}%\n")
-        f.write(f"- **Success Rate**: {stats.coverage_rate:.1f}%\n")
-        f.write(f"- **Failed Translations**: {stats.failed_fields}\n\n")
-        
-        f.write("## File Details\n\n")
-        f.write("| File | Items | Fields | Translated | Failed | Success Rate |\n")
-        f.write("|------|-------|--------|------------|--------|-------------|\n")
-        
-        for fs in stats.file_stats:
-            status = "✓" if fs.is_complete else "⚠"
-            f.write(f"| {status} {fs.filename} | {fs.total_items} | {fs.total_fields} | "
-                   f"{fs.translated_fields} | {fs.failed_fields} | {fs.translation_rate:.1f}% |\n")
-        
-        f.write("\n## Files Needing Attention\n\n")
-        needs_attention = [fs for fs in stats.file_stats if not fs.is_complete]
-        
-        if needs_attention:
-            for fs in needs_attention:
-                f.write(f"- **{fs.filename}**: {fs.failed_fields} failed translations "
-                       f"({fs.translation_rate:.1f}% success)\n")
-        else:
-            f.write("All files have been successfully translated! 🎉\n")
-    
-    print(f"\n📄 Report exported to: {output_path}")
+    rows: List[str] = []
+    for fs in stats.file_stats:
+        status = "✓" if fs.is_complete else "⚠"
+        rows.append(f"| {status} {fs.filename} | {fs.total_items} | {fs.total_fields} | "
+                    f"{fs.translated_fields} | {fs.failed_fields} | {fs.translation_rate:.1f}% |")
+    
+    needs_attention = stats.needs_attention
+    
+    console = [
+        "",
+        "="*70,
+        "SUMMARY",
+        "="*70,
+        f"Total files processed: {stats.total_files}",
+        f"Total items: {stats.total_items}",
+        f"Total text fields: {stats.total_fields}",
+        f"Successfully translated: {stats.translated_fields} ({stats.translation_rate:.1f}%)",
+        f"Failed translations: {stats.failed_fields} ({stats.failed_fields/stats.total_fields*100:.1f}%)",
+        f"Translation coverage: {stats.coverage_rate:.1f}%",
+        "="*70,
+    ]
+    
+    if needs_attention:
+        console.append(f"\n⚠ Files with failed translations ({len(needs_attention)}):")
+        console.extend(f"  - {fs.filename}: {fs.failed_fields} failed" for fs in needs_attention)
+    
+    sys.stdout.write("\n".join(console) + "\n")
+    
+    markdown = [
+        "# Translation Verification Report",
+        "",
+        "## Summary",
+        "",
+        f"- **Total Files**: {stats.total_files}",
+        f"- **Total Items**: {stats.total_items}",
+        f"- **Total Fields**: {stats.total_fields}",
+        f"- **Translation Rate**: {stats.translation_rate:.1f}%",
+        f"- **Success Rate**: {stats.coverage_rate:.1f}%",
+        f"- **Failed Translations**: {stats.failed_fields}",
+        "",
+        "## File Details",
+        "",
+        _REPORT_TABLE_HEADER,
+        *rows,
+        "",
+        "## Files Needing Attention",
+        "",
+    ]
+    
+    if needs_attention:
+        markdown.extend(f"- **{fs.filename}**: {fs.failed_fields} failed translations "
+                        f"({fs.translation_rate:.1f}% success)" for fs in needs_attention)
+    else:
+        markdown.append("All files have been successfully translated! 🎉")
+    
+    md_path.write_text("\n".join(markdown) + "\n", encoding=config.ENCODING)
+    
+    print(f"\n📄 Report exported to: {md_path}")
 
 
 def main() -> None:
     """Main entry point."""
     verifier = TranslationVerifier(config.JSON_DIR)
     stats = verifier.verify_all_files()
-    print_summary(stats)
     
-    # Export markdown report
+    # Print summary and export markdown report
     report_path = config.JSON_DIR / "VERIFICATION_REPORT.md"
-    export_markdown_report(stats, report_path)
+    render(stats, report_path)
 
 
 if __name__ == "__main__":